@@ -1,29 +1,58 @@
 """Tengen."""
-import pint
+import importlib
+import typing as t
 
 from .__version__ import __version__
 from .cache import (
     init_cache,
     list_cache_content,
     remove_cache,
-    RAW_DATA_DIR,
-    FORMATTED_DATA_DIR,
 )
-from .dataset import to_dataset
 
-unit_registry = pint.UnitRegistry()
-
-pint.set_application_registry(unit_registry)
+# attributes mapped to the module that defines them; these modules are
+# imported on first access so that importing tengen does not import pint,
+# numpy, pandas, xarray and requests, nor resolve the cache directory
+_LAZY_ATTRS = {
+    "RAW_DATA_DIR": "cache",
+    "FORMATTED_DATA_DIR": "cache",
+    "to_dataset": "dataset",
+    "to_netcdf": "dataset",
+    "download_datetime": "download",
+    "download_file": "download",
+    "download_files": "download",
+    "read_ascii_table": "table",
+    "format_missing_carats_units": "units",
+    "unit_registry": "units",
+}
 
 __all__ = [
     "__version__",
     "init_cache",
     "unit_registry",
     "to_dataset",
+    "to_netcdf",
+    "download_datetime",
+    "download_file",
+    "download_files",
+    "read_ascii_table",
+    "format_missing_carats_units",
     "list_cache_content",
     "remove_cache",
     "RAW_DATA_DIR",
     "FORMATTED_DATA_DIR",
 ]
 
-init_cache()
+
+def __getattr__(name: str) -> t.Any:
+    try:
+        module = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # next accesses bypass __getattr__
+    return value
+
+
+def __dir__() -> t.List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
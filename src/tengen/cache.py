@@ -1,37 +1,86 @@
 """Cache module."""
+import functools
 import os
 import pathlib
 import shutil
 import typing as t
 
-# cache directory
-TENGEN_CACHE_DIR = os.environ.get(
-    "TENGEN_CACHE_DIR",
-    pathlib.Path.home() / ".tengen",
-)
+# whether the cache directories are known to exist
+_INITIALIZED = False
 
-# raw data directory
-RAW_DATA_DIR = TENGEN_CACHE_DIR / "raw"
 
-# formatted data directory
-FORMATTED_DATA_DIR = TENGEN_CACHE_DIR / "formatted"
+@functools.lru_cache(maxsize=None)
+def cache_dir() -> pathlib.Path:
+    """Return the cache directory.
+
+    The cache directory is set by the ``TENGEN_CACHE_DIR`` environment
+    variable and defaults to ``~/.tengen``. It is resolved on first call,
+    rather than when the module is imported.
+    """
+    path = os.environ.get("TENGEN_CACHE_DIR")
+    return pathlib.Path(path) if path else pathlib.Path.home() / ".tengen"
+
+
+def raw_data_dir() -> pathlib.Path:
+    """Return the raw data directory."""
+    return cache_dir() / "raw"
+
+
+def formatted_data_dir() -> pathlib.Path:
+    """Return the formatted data directory."""
+    return cache_dir() / "formatted"
+
+
+# module attributes kept for backward compatibility, computed on access
+_LAZY_ATTRS = {
+    "TENGEN_CACHE_DIR": cache_dir,
+    "RAW_DATA_DIR": raw_data_dir,
+    "FORMATTED_DATA_DIR": formatted_data_dir,
+}
+
+
+def __getattr__(name: str) -> t.Any:
+    try:
+        resolve = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    return resolve()
 
 
 def init_cache() -> None:
     """Initialise cache."""
-    TENGEN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    RAW_DATA_DIR.mkdir(parents=True, exist_ok=True)
-    FORMATTED_DATA_DIR.mkdir(parents=True, exist_ok=True)
+    global _INITIALIZED
+
+    if _INITIALIZED:
+        return
+
+    for directory in (cache_dir(), raw_data_dir(), formatted_data_dir()):
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+
+    _INITIALIZED = True
 
 
 def list_cache_content() -> t.List[str]:
     """List cache content."""
-    return [file.name for file in TENGEN_CACHE_DIR.glob("*.nc")]
+    init_cache()
+
+    with os.scandir(cache_dir()) as entries:
+        return [
+            entry.name
+            for entry in entries
+            if entry.name.endswith(".nc") and entry.is_file(follow_symlinks=False)
+        ]
 
 
 def remove_cache() -> None:
     """Remove the cache."""
+    global _INITIALIZED
+
     try:
-        shutil.rmtree(TENGEN_CACHE_DIR)
+        shutil.rmtree(cache_dir())
     except OSError as e:
-        raise ValueError(f"Could not remove cache at {TENGEN_CACHE_DIR}") from e
+        raise ValueError(f"Could not remove cache at {cache_dir()}") from e
+
+    _INITIALIZED = False
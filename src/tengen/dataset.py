@@ -1,86 +1,186 @@
 """Utility module."""
-from datetime import datetime
+from datetime import datetime, timezone
+import os
+from types import MappingProxyType
 import typing as t
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 import pint
 import xarray as xr
 
 from .__version__ import __version__
+from .units import unit_registry
 
 # CF Standard Name Table Version 77, 19 January 2021
-ATTRS = {
-    "ssi": {
-        "standard_name": "solar_irradiance_per_unit_wavelength",
-        "long_name": "solar spectral irradiance",
-        "units": "W/m^2/nm",
-    },
-    "w": {
-        "standard_name": "radiation_wavelength",
-        "long_name": "wavelength",
-        "units": "nm",
-    },
-    "t": {
-        "standard_name": "time",
-        "long_name": "time",
-    },
-}
+# (read-only: these mappings are shared by all data sets)
+ATTRS = MappingProxyType(
+    {
+        "ssi": MappingProxyType(
+            {
+                "standard_name": "solar_irradiance_per_unit_wavelength",
+                "long_name": "solar spectral irradiance",
+                "units": "W/m^2/nm",
+            }
+        ),
+        "w": MappingProxyType(
+            {
+                "standard_name": "radiation_wavelength",
+                "long_name": "wavelength",
+                "units": "nm",
+            }
+        ),
+        "t": MappingProxyType(
+            {
+                "standard_name": "time",
+                "long_name": "time",
+            }
+        ),
+    }
+)
+
+# compression settings of the variables written to netCDF files
+COMPRESSION = MappingProxyType(
+    {
+        "zlib": True,
+        "complevel": 1,
+        "shuffle": True,
+    }
+)
+
+# integer time units, from the coarsest, and their length in nanoseconds
+_TIME_UNITS = (
+    ("days", 86_400_000_000_000),
+    ("hours", 3_600_000_000_000),
+    ("minutes", 60_000_000_000),
+    ("seconds", 1_000_000_000),
+    ("milliseconds", 1_000_000),
+    ("microseconds", 1_000),
+    ("nanoseconds", 1),
+)
+
+_W_UNITS = unit_registry.Unit(ATTRS["w"]["units"])
+_SSI_UNITS = unit_registry.Unit(ATTRS["ssi"]["units"])
+
+
+def _magnitude_as(
+    q: t.Union[pint.Quantity, np.ndarray],
+    units: pint.Unit,
+) -> np.ndarray:
+    """Return the magnitude of a quantity in the given units.
+
+    The conversion is skipped if the quantity is already in these units.
+    Arrays without units are assumed to be in these units.
+
+    Args:
+        q: quantity or array.
+        units: target units (from the tengen unit registry).
+
+    Returns:
+        Magnitude of the quantity in the target units.
+    """
+    if type(q) is np.ndarray:
+        return q
+    if not hasattr(q, "m_as"):
+        return np.asarray(q)
+    if q._REGISTRY is not unit_registry:
+        # units of different registries cannot be compared
+        return q.m_as(str(units))
+    return q.magnitude if q.units == units else q.m_as(units)
+
+
+def _time_encoding(values: np.ndarray) -> t.Dict[str, str]:
+    """Return the netCDF encoding of time stamps.
+
+    Time stamps are encoded as integers since the first day, in the coarsest
+    units in which they are all exact.
+
+    Args:
+        values: time stamps (datetime64[ns]).
+
+    Returns:
+        Time encoding.
+    """
+    reference = values[0].astype("datetime64[D]")
+    offsets = (values - reference).astype(np.int64)  # in nanoseconds
+    for units, length in _TIME_UNITS:
+        if not np.any(offsets % length):
+            break
+
+    return {
+        "units": f"{units} since {reference}",
+        "calendar": "proleptic_gregorian",
+        "dtype": "int64",
+    }
 
 
 def to_dataset(
-    ssi: pint.Quantity,
-    w: pint.Quantity,
+    ssi: t.Union[pint.Quantity, np.ndarray],
+    w: t.Union[pint.Quantity, np.ndarray],
     data_url: str,
     t: t.Optional[pd.DatetimeIndex] = None,
     attrs: t.Optional[t.Dict[str, str]] = None,
+    dtype: npt.DTypeLike = np.float32,
+    data_url_datetime: t.Optional[str] = None,
 ) -> xr.Dataset:
     """Make a data set from variables values.
 
     Args:
-        ssi: solar spectral irradiance.
-        w: radiation wavelength.
+        ssi: solar spectral irradiance. If an array is passed, it is assumed
+            to be in W/m^2/nm.
+        w: radiation wavelength. If an array is passed, it is assumed to be
+            in nm.
         data_url: raw data url.
         t: time stamps.
         attrs: dataset attributes.
+        dtype: data type of the wavelength and solar spectral irradiance
+            values, also used to write them to netCDF files.
+        data_url_datetime: date and time at which the raw data was
+            downloaded. If None, the data set creation date and time.
 
     Returns:
         Solar irradiance spectrum data set.
     """
     # Prepare data coordinates and variables
+    w_values = np.ascontiguousarray(_magnitude_as(w, _W_UNITS), dtype=dtype)
+    ssi_values = np.ascontiguousarray(_magnitude_as(ssi, _SSI_UNITS), dtype=dtype)
+    encoding = {"dtype": w_values.dtype}
+
     coords = {
-        "w": ("w", w.m_as(ATTRS["w"]["units"]).astype(np.float32), ATTRS["w"]),
+        "w": xr.Variable("w", w_values, attrs=ATTRS["w"], encoding=encoding),
     }
 
     if t is not None:
-        coords["t"] = ("t", t, ATTRS["t"])
-        data_vars = {
-            "ssi": (
-                ("t", "w"),
-                ssi.m_as(ATTRS["ssi"]["units"]).astype(np.float32),
-                ATTRS["ssi"],
-            ),
-        }
+        t = pd.DatetimeIndex(t)  # also accept arrays of datetimes
+        t_values = t.values.astype("datetime64[ns]", copy=False)
+        # The time units cannot be added in 'attrs'
+        # see https://github.com/pydata/xarray/issues/1324
+        # Instead, we add it to 'encoding'
+        coords["t"] = xr.Variable(
+            "t", t_values, attrs=ATTRS["t"], encoding=_time_encoding(t_values)
+        )
+        ssi_dims = ("t", "w")
     else:
-        coords["t"] = ("t", np.empty(0), ATTRS["t"])
-        data_vars = {
-            "ssi": (
-                "w",
-                ssi.m_as(ATTRS["ssi"]["units"]).astype(np.float32),
-                ATTRS["ssi"],
-            ),
-        }
+        # no time dimension (rather than an empty one)
+        ssi_dims = ("w",)
+
+    data_vars = {
+        "ssi": xr.Variable(ssi_dims, ssi_values, attrs=ATTRS["ssi"], encoding=encoding),
+    }
 
     # Prepare attributes
-    utcnow = datetime.utcnow().replace(microsecond=0).isoformat()
-
-    _attrs = dict(
-        Conventions="CF-1.10",
-        title="unknown",
-        institution="unknown",
-        source="unknown",
-        references="unknown",
-    )
+    utcnow = datetime.now(timezone.utc).replace(microsecond=0, tzinfo=None).isoformat()
+    if data_url_datetime is None:
+        data_url_datetime = utcnow
+
+    _attrs = {
+        "Conventions": "CF-1.10",
+        "title": "unknown",
+        "institution": "unknown",
+        "source": "unknown",
+        "references": "unknown",
+    }
 
     if attrs is not None:
         _attrs.update(attrs)
@@ -90,7 +190,7 @@ def to_dataset(
         {
             "history": f"{utcnow} - data set creation by {author}",
             "data_url": data_url,
-            "data_url_datetime": utcnow,
+            "data_url_datetime": data_url_datetime,
         }
     )
 
@@ -101,10 +201,22 @@ def to_dataset(
         attrs=_attrs,
     )
 
-    # The time units cannot be added in 'attrs'
-    # see https://github.com/pydata/xarray/issues/1324
-    # Instead, we add it to 'encoding'
-    if t is not None:
-        ds.t.encoding["units"] = f"days since {str(t[0].date())}"
-
     return ds
+
+
+def to_netcdf(ds: xr.Dataset, path: os.PathLike) -> None:
+    """Save a data set to a netCDF file.
+
+    The wavelength and solar spectral irradiance variables are compressed and
+    stored with the data type in their encoding (set by 'to_dataset', or read
+    from the file the data set was opened from), in single precision if none.
+
+    Args:
+        ds: solar irradiance spectrum data set.
+        path: path to the netCDF file.
+    """
+    encoding = {
+        name: {**COMPRESSION, "dtype": ds[name].encoding.get("dtype", "float32")}
+        for name in ("w", "ssi")
+    }
+    ds.to_netcdf(path, engine="h5netcdf", encoding=encoding)
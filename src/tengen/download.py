@@ -0,0 +1,182 @@
+"""Download module."""
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from datetime import datetime, timezone
+import gzip
+import json
+import os
+import pathlib
+import posixpath
+import shutil
+import typing as t
+from urllib.parse import urlparse
+import urllib.request
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .__version__ import __version__
+
+# size of the blocks in which a response body is written to disk
+CHUNK_SIZE = 1 << 20
+
+# (connect, read) timeouts, in seconds
+TIMEOUT = (5, 60)
+
+# response headers stored, with the URL, next to a downloaded file, which
+# allow to ask the server whether the file has changed since it was
+# downloaded, with the corresponding request headers
+VALIDATORS = {
+    "ETag": "If-None-Match",
+    "Last-Modified": "If-Modified-Since",
+}
+
+# maximum number of concurrent downloads
+MAX_WORKERS = 8
+
+# session shared by all downloads
+_SESSION = requests.Session()
+_SESSION.headers.update(
+    {
+        "Accept-Encoding": "gzip, deflate",
+        "User-Agent": f"tengen/{__version__}",
+    }
+)
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=MAX_WORKERS,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[502, 503, 504],
+    ),
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+
+def _validators_path(path: pathlib.Path) -> pathlib.Path:
+    """Return the path to the validators file of a downloaded file."""
+    return path.with_name(f"{path.name}.validators.json")
+
+
+def _save(body: t.BinaryIO, path: pathlib.Path, gunzip: bool) -> None:
+    """Write a response body to a file, block by block.
+
+    Args:
+        body: Response body.
+        path: Path to save the file to.
+        gunzip: If True, the body is decompressed with gzip.
+    """
+    if gunzip:
+        body = gzip.GzipFile(fileobj=body)
+
+    # the file is written under a temporary name so that an interrupted
+    # download never leaves a truncated file at 'path'
+    part = path.with_name(f"{path.name}.part")
+    try:
+        with open(part, "wb") as f:
+            shutil.copyfileobj(body, f, length=CHUNK_SIZE)
+    except BaseException:
+        part.unlink(missing_ok=True)
+        raise
+    os.replace(part, path)
+
+
+def download_file(
+    url: str,
+    path: os.PathLike,
+    gunzip: bool = False,
+) -> pathlib.Path:
+    """Download a file.
+
+    If the file was already downloaded from the same URL, it is only
+    downloaded again if it has changed on the server (not for FTP URLs).
+
+    Args:
+        url: URL to download the file from.
+        path: Path to save the file to.
+        gunzip: If True, the file is gzip-compressed and is decompressed, as
+            it is downloaded, to ``path``.
+
+    Returns:
+        Path to the downloaded file.
+    """
+    path = pathlib.Path(path)
+
+    if urlparse(url).scheme == "ftp":  # not supported by requests
+        with closing(urllib.request.urlopen(url, timeout=TIMEOUT[1])) as response:
+            _save(response, path, gunzip)
+        return path
+
+    validators_path = _validators_path(path)
+
+    headers = {}
+    if path.is_file() and validators_path.is_file():
+        validators = json.loads(validators_path.read_text())
+        # validators are only valid for the URL they were received from
+        if validators.get("url") == url:
+            headers = {
+                VALIDATORS[k]: validators[k] for k in VALIDATORS if k in validators
+            }
+
+    with _SESSION.get(url, headers=headers, stream=True, timeout=TIMEOUT) as response:
+        response.raise_for_status()
+
+        if response.status_code == 304:  # not modified
+            return path
+
+        # decode content (e.g. gzip) transfer-encodings, like 'content' does
+        response.raw.decode_content = True
+        _save(response.raw, path, gunzip)
+
+        validators = {
+            k: response.headers[k] for k in VALIDATORS if k in response.headers
+        }
+
+    if validators:
+        validators_path.write_text(json.dumps({"url": url, **validators}))
+    elif validators_path.exists():
+        validators_path.unlink()
+
+    return path
+
+
+def download_datetime(path: os.PathLike) -> str:
+    """Return the date and time at which files were last downloaded.
+
+    Files that were not downloaded again, because they had not changed on the
+    server, keep the date and time at which they were downloaded.
+
+    Args:
+        path: Directory the files were downloaded to.
+
+    Returns:
+        Date and time (UTC, ISO 8601 format).
+    """
+    mtime = max(file.stat().st_mtime for file in pathlib.Path(path).iterdir())
+    return (
+        datetime.fromtimestamp(mtime, timezone.utc)
+        .replace(microsecond=0, tzinfo=None)
+        .isoformat()
+    )
+
+
+def download_files(urls: t.List[str], path: os.PathLike) -> t.List[pathlib.Path]:
+    """Download files concurrently to a directory.
+
+    Args:
+        urls: URLs to download the files from.
+        path: Directory to save the files to. Each file is named after the
+            last component of its URL path.
+
+    Returns:
+        Paths to the downloaded files, in the same order as ``urls``.
+    """
+    path = pathlib.Path(path)
+    files = [path / posixpath.basename(urlparse(url).path) for url in urls]
+
+    max_workers = max(1, min(MAX_WORKERS, len(urls)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(download_file, urls, files))
@@ -0,0 +1,58 @@
+"""ASCII table module."""
+import io
+import os
+import typing as t
+
+import numpy as np
+import pandas as pd
+
+
+def read_ascii_table(
+    path: os.PathLike,
+    comments: t.Sequence[str] = (),
+    skiprows: int = 0,
+    missing_values: t.Optional[t.Sequence[str]] = None,
+) -> np.ndarray:
+    """Read a whitespace-delimited numeric table.
+
+    Unless missing values are expected, all rows must have the same number of
+    values.
+
+    Args:
+        path: path to the table file.
+        comments: strings that start a comment, which runs to the end of
+            the line. Lines left blank are ignored.
+        skiprows: number of lines to skip at the beginning of the file,
+            including comment lines.
+        missing_values: strings that denote missing values, read as NaN.
+
+    Returns:
+        Table values.
+    """
+    with open(path, "rb") as f:
+        content = f.read()
+
+    if comments or skiprows:
+        # done on the raw bytes, which avoids decoding the skipped lines
+        prefixes = tuple(comment.encode() for comment in comments)
+        lines = content.splitlines()[skiprows:]
+        for prefix in prefixes:
+            lines = [line.split(prefix, 1)[0] for line in lines]
+        content = b"\n".join(line for line in lines if line.strip())
+
+    values = pd.read_csv(
+        io.BytesIO(content),
+        sep=r"\s+",
+        header=None,
+        na_values=missing_values,
+        dtype=np.float64,
+    ).to_numpy()
+
+    # rows shorter than the others are filled with NaN
+    if missing_values is None and np.isnan(values).any():
+        raise ValueError(
+            f"Could not read table at {path}: missing values (rows with "
+            "fewer values than others?)"
+        )
+
+    return values
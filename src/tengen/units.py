@@ -0,0 +1,28 @@
+"""Units module."""
+import functools
+import re
+
+import pint
+
+unit_registry = pint.UnitRegistry()
+
+pint.set_application_registry(unit_registry)
+
+# positions of the carats missing in a unit string: before a signed exponent
+# or between a unit name and an unsigned exponent
+_MISSING_CARAT = re.compile(r"(?=[-+][0-9])|(?<=[a-z ])(?=[0-9])")
+
+
+@functools.lru_cache(maxsize=64)
+def format_missing_carats_units(s: str) -> str:
+    """Add missing carats to a malformed unit string.
+
+    Will format a string 'm-1' to 'm^-1'.
+
+    Args:
+        s: Unit string.
+
+    Returns:
+        Formatted unit string.
+    """
+    return _MISSING_CARAT.sub("^", s)